@@ -1,5 +1,8 @@
+import os
 import pickle
-from functools import wraps
+import sys
+from functools import partial, wraps
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Dict
 
@@ -19,8 +22,7 @@ def load_phonebook(filename=PHONEBOOK_FILE) -> AddressBook:
     """
     path = Path(filename)
     try:
-        with open(path, "rb") as file:
-            return pickle.load(file)
+        return pickle.loads(path.read_bytes())
     except FileNotFoundError:
         return AddressBook()
 
@@ -36,8 +38,23 @@ def save_phonebook(phonebook: AddressBook, filename=PHONEBOOK_FILE) -> None:
         None
     """
     path = Path(filename)
-    with open(path, "wb") as file:
-        pickle.dump(phonebook, file)
+    data = pickle.dumps(phonebook, protocol=pickle.HIGHEST_PROTOCOL)
+    try:
+        if path.read_bytes() == data:  # Nothing changed, e.g. a read-only session
+            return
+    except FileNotFoundError:
+        pass
+    # Write to a temporary file and swap it in, so a crash never leaves a truncated phonebook
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, path)
 
 
 def input_error(func):
@@ -46,7 +63,6 @@ def input_error(func):
     __errors__:
         - KeyError:
         - ValueError:
-        - IndexError:
     __return__: str
         The error message
     """
@@ -59,8 +75,6 @@ def input_error(func):
             return str(e)
         except ValueError as e:
             return str(e)
-        except IndexError as e:
-            return "Invalid command.\nAvailable commands:\nhello, add, change, delete, search, show, close, exit"
 
     return wrapper
 
@@ -119,10 +133,14 @@ def change_contact(name: str, new_phone: str, phonebook: AddressBook) -> None:
     """
     record = phonebook.get(name)
     if not record:
-        raise ValueError(f"Contact {name} not found.")
+        print(f"Contact {name} not found.")
+        return
+
+    if not record.phones:
+        raise ValueError(f"Contact {name} has no phone to change.")
 
     new_phone = normalize_phone(new_phone)
-    record.edit_phone(record.phones[0].value, new_phone)
+    record.edit_phone(next(iter(record.phones)), new_phone)
     print(f"Contact {name} updated.\nNew phone: {new_phone}")
 
 
@@ -139,7 +157,8 @@ def delete_contact(name: str, phonebook: AddressBook) -> None:
         None
     """
     if not phonebook.find(name):
-        raise ValueError(f"Contact {name} not found.")
+        print(f"Contact {name} not found.")
+        return
     phonebook.delete_record(name)
     print(f"Contact {name} deleted.")
 
@@ -157,15 +176,12 @@ def search_contact(pattern: str, phonebook: AddressBook) -> None:
         None
     """
 
-    found = False
-
-    for name, record in phonebook.items():
-        if pattern.lower() in name.lower() or any(pattern.lower() in phone.value.lower() for phone in record.phones):
-            print(f"{name}: {'; '.join(phone.value for phone in record.phones)}")
-            found = True
+    found = phonebook.search(pattern)
+    for record in found:
+        print(f"{record.name.value}: {'; '.join(record.phones)}")
 
     if not found:
-        raise ValueError(f"Contact {pattern} not found.")
+        print(f"Contact {pattern} not found.")
 
 
 @input_error
@@ -182,9 +198,9 @@ def show_phonebook(phonebook: AddressBook, sorted_=True) -> None:
     """
     records = list(phonebook.values())
     if sorted_:  # Sort the phonebook by name
-        records.sort(key=lambda x: x.name.value)
-    for contact in records:
-        print(contact)
+        records.sort(key=attrgetter('name.value'))
+    if records:
+        print('\n'.join(map(str, records)))
 
 
 @input_error
@@ -203,7 +219,8 @@ def add_birthday(name: str, birthday: str, phonebook: AddressBook) -> None:
     """
     record = phonebook.find(name)
     if not record:
-        raise ValueError(f"Contact {name} not found.")
+        print(f"Contact {name} not found.")
+        return
 
     record.add_birthday(birthday)
     print(f"Birthday for contact {name} added: {birthday}")
@@ -223,7 +240,8 @@ def show_birthday(name: str, phonebook: AddressBook) -> None:
     """
     record = phonebook.find(name)
     if not record:
-        raise ValueError(f"Contact {name} not found.")
+        print(f"Contact {name} not found.")
+        return
 
     if record.birthday:
         print(f"Birthday for contact {name}: {record.birthday.value.strftime('%A, %B %d')}")
@@ -244,45 +262,74 @@ def birthdays(phonebook: AddressBook) -> None:
     upcoming_birthdays = phonebook.get_upcoming_birthdays()
     if not upcoming_birthdays:
         print("No upcoming birthdays in the next week.")
+        return
 
     print("Upcoming birthdays in the next week:")
     for name, birthday, congrats_day in upcoming_birthdays:
         print(f"{name} on {birthday.strftime('%A, %B %d')} (congratulate on {congrats_day.strftime('%A, %B %d')})")
 
 
+def read_commands():
+    """Generator of command lines for the bot.
+
+    Prompts the user with input() in an interactive terminal and iterates the buffered sys.stdin otherwise,
+    so the bot can replay a file of commands piped into it.
+
+    __return__:
+        Iterator[str]
+    """
+    if sys.stdin.isatty():
+        while True:
+            try:
+                yield input("command: ")
+            except EOFError:
+                return
+    else:
+        yield from sys.stdin
+
+
 def main(phonebook=None):
     print("Welcome to the assistant bot!")
 
     if phonebook is None:  # Load the phonebook if not provided
         phonebook = load_phonebook()
 
+    # command -> (handler, names of the arguments it takes); extra arguments are ignored
     commands = {
-        "hello": lambda _: print("How can I help you?"),
-        "add": lambda args: add_contact(args[0], phonebook, phone=args[1]),
-        "change": lambda args: change_contact(args[0], args[1], phonebook),
-        "delete": lambda args: delete_contact(args[0], phonebook),
-        "search": lambda args: search_contact(args[0], phonebook),
-        "show": lambda args: show_phonebook(phonebook, sorted_=False),
-        "all": lambda args: show_phonebook(phonebook, sorted_=False),
-        "close": lambda _: print("Good bye!"),
-        "exit": lambda _: print("Good bye!"),
-        "phone": lambda args: search_contact(args[0], phonebook),
-        "add-birthday": lambda args: add_birthday(args[0], args[1], phonebook),
-        "show-birthday": lambda args: show_birthday(args[0], phonebook),
-        "birthdays": lambda _: birthdays(phonebook)
+        "hello": (lambda: print("How can I help you?"), ()),
+        "add": (lambda name, phone: add_contact(name, phonebook, phone=phone), ("name", "phone")),
+        "change": (partial(change_contact, phonebook=phonebook), ("name", "new_phone")),
+        "delete": (partial(delete_contact, phonebook=phonebook), ("name",)),
+        "search": (partial(search_contact, phonebook=phonebook), ("pattern",)),
+        "show": (partial(show_phonebook, phonebook, sorted_=False), ()),
+        "all": (partial(show_phonebook, phonebook, sorted_=False), ()),
+        "close": (lambda: print("Good bye!"), ()),
+        "exit": (lambda: print("Good bye!"), ()),
+        "phone": (partial(search_contact, phonebook=phonebook), ("pattern",)),
+        "add-birthday": (partial(add_birthday, phonebook=phonebook), ("name", "birthday")),
+        "show-birthday": (partial(show_birthday, phonebook=phonebook), ("name",)),
+        "birthdays": (partial(birthdays, phonebook), ())
         }
 
-    while True:
-        command = input("command: ").strip().split()
-        cmd = command[0].lower()
+    for line in read_commands():
+        command = line.split()
+        if not command:  # Skip empty lines
+            continue
+        cmd = command[0].casefold()
         args = command[1:]
 
-        if cmd in ["close", "exit"]:
-            commands[cmd](args)
-            break
-        elif cmd in commands:
+        if cmd in commands:
+            handler, params = commands[cmd]
+            if len(args) < len(params):
+                print(f"Usage: {cmd} {' '.join(f'<{param}>' for param in params)}")
+                continue
+            if cmd in ("close", "exit"):
+                handler()
+                break
             try:
-                commands[cmd](args)
+                error = handler(*args[:len(params)])
+                if error:  # input_error returns the message of a handled error
+                    print("[ERROR]", error)
             except Exception as e:
                 print("[ERROR]", e)
         else:
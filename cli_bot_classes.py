@@ -1,8 +1,22 @@
+from calendar import isleap
 from collections import UserDict
 from datetime import date, timedelta
-from typing import List
+from typing import Dict, List
 from normalize_phone import normalize_phone
 
+_WEEKEND_SHIFT = {5: 2, 6: 1}  # Saturday and Sunday birthdays are congratulated on Monday
+
+
+def _slots_state(state):
+    """Return pickled attribute values as a dict.
+
+    Objects with __slots__ are pickled as a (None, slots) tuple, while phonebooks saved
+    before __slots__ were introduced hold a plain attribute dict.
+    """
+    if isinstance(state, tuple):
+        return state[1]
+    return state
+
 
 class Field:
     """Base class for representing fields with a name and value.
@@ -12,10 +26,17 @@ class Field:
         value (str): The value of the field.
     """
 
+    __slots__ = ('name', 'value')
+
     def __init__(self, name, value):
         self.name = name
         self.value = value
 
+    def __setstate__(self, state):
+        """Restore a pickled field."""
+        for key, value in _slots_state(state).items():
+            setattr(self, key, value)
+
     def __str__(self):
         """Return a string representation of the field."""
         return f'{self.name}: {self.value}'
@@ -30,6 +51,8 @@ class Name(Field):
         name (str): The name oj contact.
     """
 
+    __slots__ = ()
+
     def __init__(self, name):
         super().__init__('Name', name)
 
@@ -45,11 +68,15 @@ class Phone(Field):
     Before storing the phone number, it is normalized using the normalize_phone function from previous HW.
     """
 
+    __slots__ = ()
+
     def __init__(self, phone):
         super().__init__('Phone', normalize_phone(phone))
 
 
 class Birthday(Field):
+    __slots__ = ()
+
     def __init__(self, value: str):
         super().__init__('Birthday', value)
         try:
@@ -60,18 +87,23 @@ class Birthday(Field):
 
 
 class Record:
-    """Class for representing a contact record with a name and a list of phones.
+    """Class for representing a contact record with a name and phones keyed by normalized number.
 
     Attributes:
         name (Name): The name of the contact. (required)
-        phones (List[Phone]): A list of phone numbers of the contact. (optional)
+        phones (Dict[str, Phone]): Phone numbers of the contact keyed by normalized number,
+            in insertion order. (optional)
         birthday (Birthday): The birthday of the contact. (optional)
+        name_lower (str): The casefolded name, precomputed for case-insensitive search.
 
     """
 
+    __slots__ = ('name', 'name_lower', 'phones', 'birthday')
+
     def __init__(self, name, phones: List[str] = None, birthday: Birthday = None):
         self.name = Name(name)
-        self.phones = []
+        self.name_lower = name.casefold()
+        self.phones: Dict[str, Phone] = {}
         self.birthday = None
         if phones is not None:
             for phone in phones:
@@ -92,9 +124,10 @@ class Record:
             ValueError: If the phone number already exists in the contact.
             ValueError (from normalize_phone): If the phone number is not valid.
         """
-        if phone in [p.value for p in self.phones]:
+        phone_obj = Phone(phone)
+        if phone_obj.value in self.phones:
             raise ValueError(f"Phone {phone} already exists")
-        self.phones.append(Phone(phone))
+        self.phones[phone_obj.value] = phone_obj
 
     def edit_phone(self, phone, new_phone):
         """Edit an existing phone number in the contact.
@@ -105,11 +138,21 @@ class Record:
 
         Returns:
             str: A message indicating the phone number was edited.
+
+        Raises:
+            ValueError: If the new phone number already exists in the contact.
         """
-        for p in self.phones:
-            if p.value == normalize_phone(phone):
-                p.value = normalize_phone(new_phone)
-                return f"Phone {phone} edited to {new_phone}"
+        target = normalize_phone(phone)
+        new_target = normalize_phone(new_phone)
+        p = self.phones.get(target)
+        if p is None:
+            return None
+        if new_target != target and new_target in self.phones:
+            raise ValueError(f"Phone {new_phone} already exists")
+        p.value = new_target
+        # rebuild instead of pop/insert to keep the phone at its position
+        self.phones = {(new_target if key == target else key): value for key, value in self.phones.items()}
+        return f"Phone {phone} edited to {new_phone}"
 
     def search_phone(self, phone):
         """Search for a phone number in the record.
@@ -120,10 +163,7 @@ class Record:
         Returns:
             Phone: The phone object if found, None otherwise.
         """
-        for p in self.phones:
-            if p.value == normalize_phone(phone):
-                return p
-        return None
+        return self.phones.get(normalize_phone(phone))
 
     def delete_phone(self, phone):
         """Delete a phone number from the record.
@@ -134,10 +174,8 @@ class Record:
         Returns:
             str: A message indicating the phone number was deleted.
         """
-        for p in self.phones:
-            if p.value == normalize_phone(phone):
-                self.phones.remove(p)
-                return f"Phone {phone} deleted"
+        if self.phones.pop(normalize_phone(phone), None) is not None:
+            return f"Phone {phone} deleted"
 
     def add_birthday(self, value):
         try:
@@ -145,10 +183,20 @@ class Record:
         except ValueError as e:
             print(e)
 
+    def __setstate__(self, state):
+        """Restore a pickled record, converting phones stored as a list by older versions."""
+        state = _slots_state(state)
+        for key, value in state.items():
+            setattr(self, key, value)
+        if 'name_lower' not in state:
+            self.name_lower = self.name.value.casefold()
+        if isinstance(self.phones, list):
+            self.phones = {p.value: p for p in self.phones}
+
     def __str__(self):
         """Return a string representation of the contact record."""
         return (f"Contact name: {self.name.value}, "
-                f"phones: {'; '.join(p.value for p in self.phones)}")
+                f"phones: {'; '.join(self.phones)}")
 
 
 class AddressBook(UserDict):
@@ -160,6 +208,7 @@ class AddressBook(UserDict):
         add_record: Add a contact record to the address book.
         find: Find a contact record by name. (in future may be by phone number)
         delete_record: Delete a contact record by name.
+        search: Search contact records by a part of the name or phone number.
     """
 
     def add_record(self, record: Record):
@@ -185,20 +234,48 @@ class AddressBook(UserDict):
         if name in self.data:
             del self.data[name]
 
+    def search(self, pattern):
+        """Search contact records by a part of the name or phone number.
+
+        Args:
+            pattern (str): Case-insensitive substring to look for.
+
+        Returns:
+            List[Record]: The matching contact records in insertion order.
+        """
+        pattern = pattern.casefold()
+        # phones are normalized to '+' and digits, so they need no casefolding
+        return [record for record in self.data.values()
+                if pattern in record.name_lower or any(pattern in phone for phone in record.phones)]
+
     def get_upcoming_birthdays(self):
+        """Collect contacts whose birthday falls within the next week.
+
+        In years without 29 February, birthdays on that day are celebrated on 28 February.
+
+        Returns:
+            List[tuple]: (name, birthday this year, congratulation day) for each contact.
+        """
         today = date.today()
+        # Birthdays from two days ago (a weekend moved to Monday) up to a week ahead, keyed by (month, day),
+        # so every record costs a single dict lookup instead of date construction and arithmetic.
+        window = {}
+        for offset in range(-2, 8):
+            birthday = today + timedelta(days=offset)
+            days_until_congrats = offset + _WEEKEND_SHIFT.get(birthday.weekday(), 0)
+            if 0 <= days_until_congrats <= 7:
+                window[(birthday.month, birthday.day)] = (birthday, today + timedelta(days=days_until_congrats))
+                if (birthday.month, birthday.day) == (2, 28) and not isleap(birthday.year):
+                    window[(2, 29)] = window[(2, 28)]
+
         upcoming_birthdays = []
         for record in self.data.values():
-            birthday_this_year = date(today.year, record.birthday.value.month, record.birthday.value.day)
-            days_until_birthday = (birthday_this_year - today).days
-            if birthday_this_year.weekday() == 5:
-                days_until_birthday += 2
-            elif birthday_this_year.weekday() == 6:
-                days_until_birthday += 1
-            if 0 <= days_until_birthday <= 7:
-                congrats_day = date.today() + timedelta(days=days_until_birthday)
-                upcoming_birthdays.append((record.name.value, birthday_this_year, congrats_day))
-        return f"Upcoming birthdays: {'\n'.join(f'{name} on {birthday}' for name, birthday, congrats_day in upcoming_birthdays)}"
+            if record.birthday is None:
+                continue
+            match = window.get((record.birthday.value.month, record.birthday.value.day))
+            if match:
+                upcoming_birthdays.append((record.name.value, *match))
+        return upcoming_birthdays
 
     def __str__(self):
         """Return a string representation of the address book."""